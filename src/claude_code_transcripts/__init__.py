@@ -1,14 +1,22 @@
 """Convert Claude Code session JSON to a clean mobile-friendly HTML page with pagination."""
 
+import asyncio
+import contextlib
 import json
 import html
+import importlib.util
 import os
+import pickle
 import platform
 import re
+import shelve
 import shutil
 import subprocess
+import sys
 import tempfile
 import webbrowser
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +27,11 @@ from jinja2 import Environment, PackageLoader
 import markdown
 import questionary
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 # Set up Jinja2 environment
 _jinja_env = Environment(
     loader=PackageLoader("claude_code_transcripts", "templates"),
@@ -35,6 +48,110 @@ def get_template(name):
     return _jinja_env.get_template(name)
 
 
+def _orjson_loads(data):
+    """Parse with orjson, retrying with json.loads on input orjson rejects.
+
+    orjson is stricter than the standard library about some input, such as
+    lone surrogate escapes left by a truncated emoji, so those documents are
+    handed to json.loads rather than dropped.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def loads_json(data):
+    """Parse a JSON document from str or bytes, using orjson when available.
+
+    Documents orjson rejects are retried with json.loads. One difference
+    remains: orjson parses integers outside the 64-bit range as floats,
+    where json.loads keeps them as exact ints.
+    Raises json.JSONDecodeError on invalid input.
+    """
+    if orjson is not None:
+        return _orjson_loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj, pretty=True):
+    """Serialize obj to UTF-8 JSON bytes, indented by two spaces if pretty.
+
+    Uses orjson when it is installed, falling back to the standard library.
+    Strings containing lone surrogates (which cannot be encoded as UTF-8)
+    are written as \\uXXXX escapes.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    if pretty:
+        kwargs = {"indent": 2}
+    else:
+        kwargs = {"separators": (",", ":")}
+    try:
+        return json.dumps(obj, ensure_ascii=False, **kwargs).encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(obj, **kwargs).encode("utf-8")
+
+
+def iter_json_chunks(obj, pretty=True):
+    """Serialize obj as JSON, yielding one list item at a time.
+
+    For a dict whose values are lists (such as the "conversations" list in
+    generate_json_output) each item is serialized separately, so the whole
+    document never has to exist as a single bytes object. The concatenated
+    chunks are identical to dumps_json(obj, pretty).
+    """
+    if not isinstance(obj, dict) or not obj:
+        yield dumps_json(obj, pretty)
+        return
+
+    if pretty:
+        key_prefix, item_prefix, colon = b"\n  ", b"\n    ", b": "
+    else:
+        key_prefix, item_prefix, colon = b"", b"", b":"
+
+    def dumps_nested(value, prefix):
+        # Serialized JSON never contains raw newlines inside strings, so
+        # nested values can be re-indented by prefixing every line
+        chunk = dumps_json(value, pretty)
+        return chunk.replace(b"\n", prefix) if pretty else chunk
+
+    yield b"{"
+    for i, (key, value) in enumerate(obj.items()):
+        yield (b"," if i else b"") + key_prefix + dumps_json(key, pretty) + colon
+        if isinstance(value, list) and value:
+            yield b"["
+            for j, item in enumerate(value):
+                yield (b"," if j else b"") + item_prefix + dumps_nested(
+                    item, item_prefix
+                )
+            yield key_prefix + b"]"
+        else:
+            yield dumps_nested(value, key_prefix)
+    yield (b"\n" if pretty else b"") + b"}"
+
+
+def write_json_output(obj, output=None, pretty=True):
+    """Write obj as JSON to the output file path, or to stdout if output is None."""
+    if output:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Binary mode skips text encoding; the 1 MiB buffer batches the many
+        # small chunks into large writes, while larger chunks bypass it
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            for chunk in iter_json_chunks(obj, pretty):
+                f.write(chunk)
+        click.echo(f"Output: {output_path.resolve()}", err=True)
+    else:
+        click.echo(dumps_json(obj, pretty))
+
+
 # Regex to match git commit output: [branch hash] message
 COMMIT_PATTERN = re.compile(r"\[[\w\-/]+ ([a-f0-9]{7,})\] (.+?)(?:\n|$)")
 
@@ -43,7 +160,17 @@ GITHUB_REPO_PATTERN = re.compile(
     r"github\.com/([a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+)/pull/new/"
 )
 
+# Regex to extract owner/repo from a GitHub repository URL (e.g., https://github.com/owner/repo.git)
+GITHUB_URL_REPO_PATTERN = re.compile(r"github\.com/([^/]+/[^/]+?)(?:\.git)?$")
+
 PROMPTS_PER_PAGE = 5
+
+# Minimum total size of session files to summarize before worker processes
+# are used. Starting a pool with the "spawn" method (the default on macOS and
+# Windows) takes about 0.7s while every worker re-imports this module, and a
+# summary usually needs only the first few lines of a file, so the pool only
+# pays off for very large batches
+PARALLEL_SUMMARY_MIN_BYTES = 256 * 1024 * 1024
 LONG_TEXT_THRESHOLD = (
     300  # Characters - text blocks longer than this are shown in index
 )
@@ -82,6 +209,9 @@ _github_repo = None
 API_BASE_URL = "https://api.anthropic.com/v1"
 ANTHROPIC_VERSION = "2023-06-01"
 
+# Maximum number of sessions fetched at the same time by fetch_sessions_by_id
+MAX_CONCURRENT_FETCHES = 8
+
 
 def get_session_summary(filepath, max_length=200):
     """Extract a human-readable summary from a session file.
@@ -95,8 +225,7 @@ def get_session_summary(filepath, max_length=200):
             return _get_jsonl_summary(filepath, max_length)
         else:
             # For JSON files, try to get first user message
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = loads_json(filepath.read_bytes())
             loglines = data.get("loglines", [])
             for entry in loglines:
                 if entry.get("type") == "user":
@@ -121,7 +250,7 @@ def _get_jsonl_summary(filepath, max_length=200):
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = loads_json(line)
                     # First priority: summary type entries
                     if obj.get("type") == "summary" and obj.get("summary"):
                         summary = obj["summary"]
@@ -138,7 +267,7 @@ def _get_jsonl_summary(filepath, max_length=200):
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = loads_json(line)
                     if (
                         obj.get("type") == "user"
                         and not obj.get("isMeta")
@@ -158,21 +287,118 @@ def _get_jsonl_summary(filepath, max_length=200):
     return "(no summary)"
 
 
-def find_local_sessions(folder, limit=10):
+def get_summary_cache_path():
+    """Return the path of the on-disk session summary cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")
+    return Path(cache_home) / "claude-code-transcripts" / "summaries"
+
+
+@contextlib.contextmanager
+def open_summary_cache(path=None):
+    """Open the session summary cache as a dict-like shelf.
+
+    Yields an empty dict instead if the cache cannot be opened, so a broken
+    or unwritable cache never prevents sessions from being listed.
+    """
+    path = Path(path or get_summary_cache_path())
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        cache = shelve.open(str(path), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        yield {}
+        return
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+def get_session_summaries(filepaths, cache=None):
+    """Get summaries for many session files as a {Path: summary} dict.
+
+    If cache is given (see open_summary_cache), cached summaries are reused
+    for files whose modification time and size have not changed, and entries
+    for files not in filepaths are removed. When the remaining files add up
+    to at least PARALLEL_SUMMARY_MIN_BYTES and more than one CPU is available,
+    they are summarized in worker processes.
+    """
+    filepaths = list(filepaths)
+    summaries = {}
+    signatures = {}
+    pending = []
+    pending_bytes = 0
+    for filepath in filepaths:
+        try:
+            stat = filepath.stat()
+        except OSError:
+            # Dangling symlink or file removed since it was found; it is
+            # left uncached and get_session_summary reports no summary
+            pending.append(filepath)
+            continue
+        if cache is not None:
+            signatures[filepath] = (stat.st_mtime_ns, stat.st_size)
+            try:
+                cached = cache.get(str(filepath))
+            except Exception:
+                cached = None
+            if cached is not None and cached[0] == signatures[filepath]:
+                summaries[filepath] = cached[1]
+                continue
+        pending.append(filepath)
+        pending_bytes += stat.st_size
+
+    computed = None
+    if pending_bytes >= PARALLEL_SUMMARY_MIN_BYTES and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as executor:
+                computed = list(executor.map(get_session_summary, pending, chunksize=4))
+        except Exception:
+            # Process pools are unavailable on some platforms
+            computed = None
+    if computed is None:
+        computed = [get_session_summary(filepath) for filepath in pending]
+
+    for filepath, summary in zip(pending, computed):
+        summaries[filepath] = summary
+        if cache is not None and filepath in signatures:
+            try:
+                cache[str(filepath)] = (signatures[filepath], summary)
+            except Exception:
+                pass
+
+    if cache is not None:
+        _prune_summary_cache(cache, {str(filepath) for filepath in filepaths})
+    return summaries
+
+
+def _prune_summary_cache(cache, keep_keys):
+    """Remove cache entries for files that are no longer present."""
+    try:
+        for key in [key for key in cache.keys() if key not in keep_keys]:
+            del cache[key]
+    except Exception:
+        pass
+
+
+def find_local_sessions(folder, limit=10, cache=None):
     """Find recent JSONL session files in the given folder.
 
     Returns a list of (Path, summary) tuples sorted by modification time.
     Excludes agent files and warmup/empty sessions.
+
+    If cache is given (see open_summary_cache), summaries of files that
+    have not changed since they were cached are not recomputed.
     """
     folder = Path(folder)
     if not folder.exists():
         return []
 
+    files = [f for f in folder.glob("**/*.jsonl") if not f.name.startswith("agent-")]
+    summaries = get_session_summaries(files, cache=cache)
+
     results = []
-    for f in folder.glob("**/*.jsonl"):
-        if f.name.startswith("agent-"):
-            continue
-        summary = get_session_summary(f)
+    for f in files:
+        summary = summaries[f]
         # Skip boring/empty sessions
         if summary.lower() == "warmup" or summary == "(no summary)":
             continue
@@ -259,13 +485,17 @@ def find_all_sessions(folder, include_agents=False):
 
     projects = {}
 
-    for session_file in folder.glob("**/*.jsonl"):
-        # Skip agent files unless requested
-        if not include_agents and session_file.name.startswith("agent-"):
-            continue
+    # Skip agent files unless requested
+    session_files = [
+        f
+        for f in folder.glob("**/*.jsonl")
+        if include_agents or not f.name.startswith("agent-")
+    ]
+    summaries = get_session_summaries(session_files)
 
+    for session_file in session_files:
         # Get summary and skip boring sessions
-        summary = get_session_summary(session_file)
+        summary = summaries[session_file]
         if summary.lower() == "warmup" or summary == "(no summary)":
             continue
 
@@ -460,42 +690,76 @@ def parse_session_file(filepath):
         return _parse_jsonl_file(filepath)
     else:
         # Standard JSON format
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return loads_json(filepath.read_bytes())
 
 
 def _parse_jsonl_file(filepath):
     """Parse JSONL file and convert to standard format."""
-    loglines = []
+    # Read the whole file in one go and split on newlines, which is much
+    # cheaper than iterating over a text-mode file object line by line
+    return _parse_jsonl_bytes(Path(filepath).read_bytes())
+
+
+def _intern_message_strings(message):
+    """Intern the small set of repeated strings in a parsed message.
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+    Roles, content block types and tool names recur on almost every line of
+    a session, so interning them means each distinct value is stored once.
+    Returns the message, modified in place.
+    """
+    if not isinstance(message, dict):
+        return message
+    role = message.get("role")
+    if type(role) is str:
+        message["role"] = sys.intern(role)
+    content = message.get("content")
+    if isinstance(content, list):
+        for block in content:
+            if not isinstance(block, dict):
                 continue
-            try:
-                obj = json.loads(line)
-                entry_type = obj.get("type")
+            block_type = block.get("type")
+            if type(block_type) is str:
+                block["type"] = sys.intern(block_type)
+            if block_type == "tool_use":
+                name = block.get("name")
+                if type(name) is str:
+                    block["name"] = sys.intern(name)
+    return message
 
-                # Skip non-message entries
-                if entry_type not in ("user", "assistant"):
-                    continue
 
-                # Convert to standard format
-                entry = {
-                    "type": entry_type,
-                    "timestamp": obj.get("timestamp", ""),
-                    "message": obj.get("message", {}),
-                }
+def _parse_jsonl_bytes(data):
+    """Parse JSONL bytes and convert to standard format."""
+    loglines = []
+    # Resolve the parser once rather than per line
+    loads = _orjson_loads if orjson is not None else json.loads
 
-                # Preserve isCompactSummary if present
-                if obj.get("isCompactSummary"):
-                    entry["isCompactSummary"] = True
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = loads(line)
+            entry_type = obj.get("type")
 
-                loglines.append(entry)
-            except json.JSONDecodeError:
+            # Skip non-message entries
+            if entry_type not in ("user", "assistant"):
                 continue
 
+            # Convert to standard format
+            entry = {
+                "type": sys.intern(entry_type),
+                "timestamp": obj.get("timestamp", ""),
+                "message": _intern_message_strings(obj.get("message", {})),
+            }
+
+            # Preserve isCompactSummary if present
+            if obj.get("isCompactSummary"):
+                entry["isCompactSummary"] = True
+
+            loglines.append(entry)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+
     return {"loglines": loglines}
 
 
@@ -565,6 +829,22 @@ def get_api_headers(token, org_uuid):
     }
 
 
+def _http2_available():
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def make_api_client():
+    """Create the httpx.AsyncClient shared by all requests in fetch_sessions_by_id.
+
+    Reusing one client across requests keeps connections open between them.
+    HTTP/2 is used when the optional h2 package is installed, and failed
+    connection attempts are retried.
+    """
+    transport = httpx.AsyncHTTPTransport(http2=_http2_available(), retries=3)
+    return httpx.AsyncClient(transport=transport)
+
+
 def fetch_sessions(token, org_uuid):
     """Fetch list of sessions from the API.
 
@@ -577,20 +857,61 @@ def fetch_sessions(token, org_uuid):
     return response.json()
 
 
+def _session_request(token, org_uuid, session_id):
+    """Build the (url, request kwargs) pair for fetching a single session."""
+    return f"{API_BASE_URL}/session_ingress/session/{session_id}", {
+        "headers": get_api_headers(token, org_uuid),
+        "timeout": 60.0,
+    }
+
+
+def _session_response_data(response):
+    """Return the session data from an API response, raising on HTTP errors."""
+    response.raise_for_status()
+    return response.json()
+
+
 def fetch_session(token, org_uuid, session_id):
     """Fetch a specific session from the API.
 
     Returns the session data as a dict.
     Raises httpx.HTTPError on network/API errors.
     """
-    headers = get_api_headers(token, org_uuid)
-    response = httpx.get(
-        f"{API_BASE_URL}/session_ingress/session/{session_id}",
-        headers=headers,
-        timeout=60.0,
-    )
-    response.raise_for_status()
-    return response.json()
+    url, kwargs = _session_request(token, org_uuid, session_id)
+    return _session_response_data(httpx.get(url, **kwargs))
+
+
+async def fetch_session_async(token, org_uuid, session_id, client):
+    """Fetch a specific session from the API using an httpx.AsyncClient.
+
+    Returns the session data as a dict.
+    Raises httpx.HTTPError on network/API errors.
+    """
+    url, kwargs = _session_request(token, org_uuid, session_id)
+    return _session_response_data(await client.get(url, **kwargs))
+
+
+async def _fetch_sessions_concurrently(token, org_uuid, session_ids):
+    """Fetch sessions with at most MAX_CONCURRENT_FETCHES requests in flight."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    async with make_api_client() as client:
+
+        async def fetch(session_id):
+            async with semaphore:
+                return await fetch_session_async(token, org_uuid, session_id, client)
+
+        return await asyncio.gather(*(fetch(session_id) for session_id in session_ids))
+
+
+def fetch_sessions_by_id(token, org_uuid, session_ids):
+    """Fetch several sessions from the API concurrently.
+
+    All requests share one client from make_api_client, and at most
+    MAX_CONCURRENT_FETCHES are made at the same time.
+    Returns a list of session data dicts in the same order as session_ids.
+    Raises httpx.HTTPError on network/API errors.
+    """
+    return asyncio.run(_fetch_sessions_concurrently(token, org_uuid, session_ids))
 
 
 def detect_github_repo(loglines):
@@ -646,7 +967,7 @@ def extract_repo_from_session(session):
             # Parse github.com/owner/repo from URL
             if "github.com/" in url:
                 # Extract owner/repo from https://github.com/owner/repo
-                match = re.search(r"github\.com/([^/]+/[^/]+?)(?:\.git)?$", url)
+                match = GITHUB_URL_REPO_PATTERN.search(url)
                 if match:
                     return match.group(1)
 
@@ -862,12 +1183,62 @@ def make_msg_id(timestamp):
     return f"msg-{timestamp.replace(':', '-').replace('.', '-')}"
 
 
+def _analyze_tool_use(block, timestamp, stats):
+    """Count a tool_use block by tool name."""
+    stats["tool_counts"][block.get("name", "Unknown")] += 1
+
+
+def _analyze_tool_result(block, timestamp, stats):
+    """Collect git commits from a tool_result block's output."""
+    result_content = block.get("content", "")
+    if isinstance(result_content, str):
+        for match in COMMIT_PATTERN.finditer(result_content):
+            stats["commits"].append((match.group(1), match.group(2), timestamp))
+
+
+def _analyze_text(block, timestamp, stats):
+    """Collect text blocks long enough to be shown in the index."""
+    text = block.get("text", "")
+    if len(text) >= LONG_TEXT_THRESHOLD:
+        stats["long_texts"].append(text)
+
+
+# Content block type -> handler used by analyze_conversation
+_ANALYZE_BLOCK_HANDLERS = {
+    "tool_use": _analyze_tool_use,
+    "tool_result": _analyze_tool_result,
+    "text": _analyze_text,
+}
+
+
+def _new_conversation_stats():
+    return {
+        "tool_counts": Counter(),  # tool_name -> count
+        "long_texts": [],
+        "commits": [],  # list of (hash, message, timestamp)
+    }
+
+
+def _analyze_message_data(message_data, timestamp, stats):
+    """Accumulate tool counts, commits and long texts for one parsed message."""
+    content = message_data.get("content", [])
+    if not isinstance(content, list):
+        return
+
+    for block in content:
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get("type")
+        if type(block_type) is not str:
+            continue
+        handler = _ANALYZE_BLOCK_HANDLERS.get(block_type)
+        if handler:
+            handler(block, timestamp, stats)
+
+
 def analyze_conversation(messages):
     """Analyze messages in a conversation to extract stats and long texts."""
-    tool_counts = {}  # tool_name -> count
-    long_texts = []
-    commits = []  # list of (hash, message, timestamp)
-
+    parsed_messages = []
     for log_type, message_json, timestamp in messages:
         if not message_json:
             continue
@@ -875,35 +1246,17 @@ def analyze_conversation(messages):
             message_data = json.loads(message_json)
         except json.JSONDecodeError:
             continue
+        parsed_messages.append((log_type, message_data, timestamp))
+    return _analyze_conversation_data(parsed_messages)
 
-        content = message_data.get("content", [])
-        if not isinstance(content, list):
-            continue
-
-        for block in content:
-            if not isinstance(block, dict):
-                continue
-            block_type = block.get("type", "")
 
-            if block_type == "tool_use":
-                tool_name = block.get("name", "Unknown")
-                tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
-            elif block_type == "tool_result":
-                # Check for git commit output
-                result_content = block.get("content", "")
-                if isinstance(result_content, str):
-                    for match in COMMIT_PATTERN.finditer(result_content):
-                        commits.append((match.group(1), match.group(2), timestamp))
-            elif block_type == "text":
-                text = block.get("text", "")
-                if len(text) >= LONG_TEXT_THRESHOLD:
-                    long_texts.append(text)
-
-    return {
-        "tool_counts": tool_counts,
-        "long_texts": long_texts,
-        "commits": commits,
-    }
+def _analyze_conversation_data(messages):
+    """Analyze (log_type, message_data, timestamp) tuples of parsed messages."""
+    stats = _new_conversation_stats()
+    for log_type, message_data, timestamp in messages:
+        _analyze_message_data(message_data, timestamp, stats)
+    stats["tool_counts"] = dict(stats["tool_counts"])
+    return stats
 
 
 def generate_json_output(json_path, github_repo=None):
@@ -916,19 +1269,28 @@ def generate_json_output(json_path, github_repo=None):
     Returns:
         Dict with metadata, stats, conversations, and commits
     """
-    from datetime import datetime, timezone
+    data = parse_session_file(Path(json_path))
+    return _build_json_output(data.get("loglines", []), github_repo)
 
-    json_path = Path(json_path)
-    data = parse_session_file(json_path)
-    loglines = data.get("loglines", [])
+
+def _build_json_output(loglines, github_repo=None):
+    """Build the JSON output dict from normalized loglines.
+
+    Conversations are grouped and analyzed in a single pass over the
+    loglines, with per-conversation stats kept in a list parallel to
+    the conversations until they are attached at the end.
+    """
+    from datetime import datetime, timezone
 
     # Auto-detect GitHub repo if not provided
     if github_repo is None:
         github_repo = detect_github_repo(loglines)
 
-    # Build conversations from loglines
+    # Build and analyze conversations from loglines
     conversations = []
+    conv_stats = []
     current_conv = None
+    current_stats = None
     for entry in loglines:
         log_type = entry.get("type")
         timestamp = entry.get("timestamp", "")
@@ -948,16 +1310,18 @@ def generate_json_output(json_path, github_repo=None):
                 user_text = text
 
         if is_user_prompt:
-            if current_conv:
-                conversations.append(current_conv)
             current_conv = {
                 "user_text": user_text,
                 "timestamp": timestamp,
                 "is_continuation": bool(is_compact_summary),
                 "messages": [],
             }
+            current_stats = _new_conversation_stats()
+            conversations.append(current_conv)
+            conv_stats.append(current_stats)
 
-        # Add message to current conversation
+        # Add message to current conversation. The parsed message dict is
+        # shared rather than copied, since the output is only serialized
         if current_conv:
             current_conv["messages"].append(
                 {
@@ -966,26 +1330,16 @@ def generate_json_output(json_path, github_repo=None):
                     "content": message_data,
                 }
             )
+            _analyze_message_data(message_data, timestamp, current_stats)
 
-    if current_conv:
-        conversations.append(current_conv)
-
-    # Calculate stats for each conversation and overall
-    total_tool_counts = {}
+    # Attach stats to each conversation and aggregate overall stats
+    total_tool_counts = Counter()
     total_messages = 0
     all_commits = []  # list of dicts with hash, message, timestamp, conversation_index
 
-    for conv_idx, conv in enumerate(conversations):
-        # Build messages in format expected by analyze_conversation
-        messages_for_analysis = [
-            (msg["type"], json.dumps(msg["content"]), msg["timestamp"])
-            for msg in conv["messages"]
-        ]
-        stats = analyze_conversation(messages_for_analysis)
-
-        # Add stats to conversation
+    for conv_idx, (conv, stats) in enumerate(zip(conversations, conv_stats)):
         conv["stats"] = {
-            "tool_counts": stats["tool_counts"],
+            "tool_counts": dict(stats["tool_counts"]),
             "commits": [
                 {"hash": h, "message": m, "timestamp": t}
                 for h, m, t in stats["commits"]
@@ -993,10 +1347,8 @@ def generate_json_output(json_path, github_repo=None):
             "long_texts": stats["long_texts"],
         }
 
-        # Aggregate overall stats
         total_messages += len(conv["messages"])
-        for tool, count in stats["tool_counts"].items():
-            total_tool_counts[tool] = total_tool_counts.get(tool, 0) + count
+        total_tool_counts.update(stats["tool_counts"])
         for commit_hash, commit_msg, commit_ts in stats["commits"]:
             all_commits.append(
                 {
@@ -1022,7 +1374,7 @@ def generate_json_output(json_path, github_repo=None):
             "total_messages": total_messages,
             "total_tool_calls": sum(total_tool_counts.values()),
             "total_commits": len(all_commits),
-            "tool_counts": total_tool_counts,
+            "tool_counts": dict(total_tool_counts),
         },
         "conversations": conversations,
         "commits": all_commits,
@@ -1076,6 +1428,11 @@ def render_message(log_type, message_json, timestamp):
         message_data = json.loads(message_json)
     except json.JSONDecodeError:
         return ""
+    return _render_message_data(log_type, message_data, timestamp)
+
+
+def _render_message_data(log_type, message_data, timestamp):
+    """Render an already-parsed message dict (see render_message)."""
     if log_type == "user":
         content_html = render_user_message_content(message_data)
         # Check if this is a tool result message
@@ -1450,8 +1807,6 @@ def generate_html(json_path, output_dir, github_repo=None):
         message_data = entry.get("message", {})
         if not message_data:
             continue
-        # Convert message dict to JSON string for compatibility with existing render functions
-        message_json = json.dumps(message_data)
         is_user_prompt = False
         user_text = None
         if log_type == "user":
@@ -1466,11 +1821,11 @@ def generate_html(json_path, output_dir, github_repo=None):
             current_conv = {
                 "user_text": user_text,
                 "timestamp": timestamp,
-                "messages": [(log_type, message_json, timestamp)],
+                "messages": [(log_type, message_data, timestamp)],
                 "is_continuation": bool(is_compact_summary),
             }
         elif current_conv:
-            current_conv["messages"].append((log_type, message_json, timestamp))
+            current_conv["messages"].append((log_type, message_data, timestamp))
     if current_conv:
         conversations.append(current_conv)
 
@@ -1484,8 +1839,8 @@ def generate_html(json_path, output_dir, github_repo=None):
         messages_html = []
         for conv in page_convs:
             is_first = True
-            for log_type, message_json, timestamp in conv["messages"]:
-                msg_html = render_message(log_type, message_json, timestamp)
+            for log_type, message_data, timestamp in conv["messages"]:
+                msg_html = _render_message_data(log_type, message_data, timestamp)
                 if msg_html:
                     # Wrap continuation summaries in collapsed details
                     if is_first and conv.get("is_continuation"):
@@ -1508,14 +1863,13 @@ def generate_html(json_path, output_dir, github_repo=None):
         print(f"Generated page-{page_num:03d}.html")
 
     # Calculate overall stats and collect all commits for timeline
-    total_tool_counts = {}
+    total_tool_counts = Counter()
     total_messages = 0
     all_commits = []  # (timestamp, hash, message, page_num, conv_index)
     for i, conv in enumerate(conversations):
         total_messages += len(conv["messages"])
-        stats = analyze_conversation(conv["messages"])
-        for tool, count in stats["tool_counts"].items():
-            total_tool_counts[tool] = total_tool_counts.get(tool, 0) + count
+        stats = _analyze_conversation_data(conv["messages"])
+        total_tool_counts.update(stats["tool_counts"])
         page_num = (i // PROMPTS_PER_PAGE) + 1
         for commit_hash, commit_msg, commit_ts in stats["commits"]:
             all_commits.append((commit_ts, commit_hash, commit_msg, page_num, i))
@@ -1547,7 +1901,7 @@ def generate_html(json_path, output_dir, github_repo=None):
             all_messages.extend(conversations[j]["messages"])
 
         # Analyze conversation for stats (excluding commits from inline display now)
-        stats = analyze_conversation(all_messages)
+        stats = _analyze_conversation_data(all_messages)
         tool_stats_str = format_tool_stats(stats["tool_counts"])
 
         long_texts_html = ""
@@ -1623,7 +1977,12 @@ def cli():
     is_flag=True,
     help="Output as JSON instead of table format.",
 )
-def local_cmd(session_file, output, repo, limit, output_json):
+@click.option(
+    "--pretty/--compact",
+    default=False,
+    help="Indent the JSON output for readability (default: compact).",
+)
+def local_cmd(session_file, output, repo, limit, output_json, pretty):
     """List local Claude Code sessions or convert a specific session to JSON.
 
     If SESSION_FILE is provided, outputs the session as JSON.
@@ -1639,14 +1998,7 @@ def local_cmd(session_file, output, repo, limit, output_json):
         result = generate_json_output(session_path, github_repo=repo)
 
         # Output to file or stdout
-        if output:
-            output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            click.echo(f"Output: {output_path.resolve()}", err=True)
-        else:
-            click.echo(json.dumps(result, indent=2, ensure_ascii=False))
+        write_json_output(result, output, pretty=pretty)
         return
 
     # No session file - list available sessions
@@ -1657,7 +2009,8 @@ def local_cmd(session_file, output, repo, limit, output_json):
             click.echo(json.dumps([]))
         return
 
-    results = find_local_sessions(projects_folder, limit=limit)
+    with open_summary_cache() as cache:
+        results = find_local_sessions(projects_folder, limit=limit, cache=cache)
 
     if not results:
         if output_json or output:
@@ -1678,14 +2031,8 @@ def local_cmd(session_file, output, repo, limit, output_json):
         )
 
     # Output to file or JSON stdout
-    if output:
-        output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(session_list, f, indent=2, ensure_ascii=False)
-        click.echo(f"Output: {output_path.resolve()}", err=True)
-    elif output_json:
-        click.echo(json.dumps(session_list, indent=2, ensure_ascii=False))
+    if output or output_json:
+        write_json_output(session_list, output, pretty=pretty)
     else:
         # Plain text output for easy copy-paste
         for idx, session in enumerate(session_list, 1):
@@ -1749,7 +2096,12 @@ def fetch_url_to_tempfile(url):
     "--repo",
     help="GitHub repo (owner/name) for commit links. Auto-detected from git push output if not specified.",
 )
-def json_cmd(json_file, output, repo):
+@click.option(
+    "--pretty/--compact",
+    default=False,
+    help="Indent the JSON output for readability (default: compact).",
+)
+def json_cmd(json_file, output, repo, pretty):
     """Convert a Claude Code session JSON/JSONL file or URL to JSON output."""
     # Handle URL input
     if is_url(json_file):
@@ -1766,14 +2118,7 @@ def json_cmd(json_file, output, repo):
     result = generate_json_output(json_file_path, github_repo=repo)
 
     # Output to file or stdout
-    if output:
-        output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        click.echo(f"Output: {output_path.resolve()}", err=True)
-    else:
-        click.echo(json.dumps(result, indent=2, ensure_ascii=False))
+    write_json_output(result, output, pretty=pretty)
 
 
 def resolve_credentials(token, org_uuid):
@@ -1852,8 +2197,6 @@ def generate_html_from_session_data(session_data, output_dir, github_repo=None):
         message_data = entry.get("message", {})
         if not message_data:
             continue
-        # Convert message dict to JSON string for compatibility with existing render functions
-        message_json = json.dumps(message_data)
         is_user_prompt = False
         user_text = None
         if log_type == "user":
@@ -1868,11 +2211,11 @@ def generate_html_from_session_data(session_data, output_dir, github_repo=None):
             current_conv = {
                 "user_text": user_text,
                 "timestamp": timestamp,
-                "messages": [(log_type, message_json, timestamp)],
+                "messages": [(log_type, message_data, timestamp)],
                 "is_continuation": bool(is_compact_summary),
             }
         elif current_conv:
-            current_conv["messages"].append((log_type, message_json, timestamp))
+            current_conv["messages"].append((log_type, message_data, timestamp))
     if current_conv:
         conversations.append(current_conv)
 
@@ -1886,8 +2229,8 @@ def generate_html_from_session_data(session_data, output_dir, github_repo=None):
         messages_html = []
         for conv in page_convs:
             is_first = True
-            for log_type, message_json, timestamp in conv["messages"]:
-                msg_html = render_message(log_type, message_json, timestamp)
+            for log_type, message_data, timestamp in conv["messages"]:
+                msg_html = _render_message_data(log_type, message_data, timestamp)
                 if msg_html:
                     # Wrap continuation summaries in collapsed details
                     if is_first and conv.get("is_continuation"):
@@ -1910,14 +2253,13 @@ def generate_html_from_session_data(session_data, output_dir, github_repo=None):
         click.echo(f"Generated page-{page_num:03d}.html")
 
     # Calculate overall stats and collect all commits for timeline
-    total_tool_counts = {}
+    total_tool_counts = Counter()
     total_messages = 0
     all_commits = []  # (timestamp, hash, message, page_num, conv_index)
     for i, conv in enumerate(conversations):
         total_messages += len(conv["messages"])
-        stats = analyze_conversation(conv["messages"])
-        for tool, count in stats["tool_counts"].items():
-            total_tool_counts[tool] = total_tool_counts.get(tool, 0) + count
+        stats = _analyze_conversation_data(conv["messages"])
+        total_tool_counts.update(stats["tool_counts"])
         page_num = (i // PROMPTS_PER_PAGE) + 1
         for commit_hash, commit_msg, commit_ts in stats["commits"]:
             all_commits.append((commit_ts, commit_hash, commit_msg, page_num, i))
@@ -1949,7 +2291,7 @@ def generate_html_from_session_data(session_data, output_dir, github_repo=None):
             all_messages.extend(conversations[j]["messages"])
 
         # Analyze conversation for stats (excluding commits from inline display now)
-        stats = analyze_conversation(all_messages)
+        stats = _analyze_conversation_data(all_messages)
         tool_stats_str = format_tool_stats(stats["tool_counts"])
 
         long_texts_html = ""
@@ -2005,119 +2347,11 @@ def generate_json_output_from_session_data(session_data, github_repo=None):
     Returns:
         Dict with metadata, stats, conversations, and commits
     """
-    from datetime import datetime, timezone
-
-    loglines = session_data.get("loglines", [])
-
-    # Auto-detect GitHub repo if not provided
-    if github_repo is None:
-        github_repo = detect_github_repo(loglines)
-
-    # Build conversations from loglines
-    conversations = []
-    current_conv = None
-    for entry in loglines:
-        log_type = entry.get("type")
-        timestamp = entry.get("timestamp", "")
-        is_compact_summary = entry.get("isCompactSummary", False)
-        message_data = entry.get("message", {})
-        if not message_data:
-            continue
-
-        # Determine if this is a user prompt
-        is_user_prompt = False
-        user_text = None
-        if log_type == "user":
-            content = message_data.get("content", "")
-            text = extract_text_from_content(content)
-            if text:
-                is_user_prompt = True
-                user_text = text
-
-        if is_user_prompt:
-            if current_conv:
-                conversations.append(current_conv)
-            current_conv = {
-                "user_text": user_text,
-                "timestamp": timestamp,
-                "is_continuation": bool(is_compact_summary),
-                "messages": [],
-            }
-
-        # Add message to current conversation
-        if current_conv:
-            current_conv["messages"].append(
-                {
-                    "type": log_type,
-                    "timestamp": timestamp,
-                    "content": message_data,
-                }
-            )
-
-    if current_conv:
-        conversations.append(current_conv)
-
-    # Calculate stats for each conversation and overall
-    total_tool_counts = {}
-    total_messages = 0
-    all_commits = []
-
-    for conv_idx, conv in enumerate(conversations):
-        # Build messages in format expected by analyze_conversation
-        messages_for_analysis = [
-            (msg["type"], json.dumps(msg["content"]), msg["timestamp"])
-            for msg in conv["messages"]
-        ]
-        stats = analyze_conversation(messages_for_analysis)
-
-        # Add stats to conversation
-        conv["stats"] = {
-            "tool_counts": stats["tool_counts"],
-            "commits": [
-                {"hash": h, "message": m, "timestamp": t}
-                for h, m, t in stats["commits"]
-            ],
-            "long_texts": stats["long_texts"],
-        }
-
-        # Aggregate overall stats
-        total_messages += len(conv["messages"])
-        for tool, count in stats["tool_counts"].items():
-            total_tool_counts[tool] = total_tool_counts.get(tool, 0) + count
-        for commit_hash, commit_msg, commit_ts in stats["commits"]:
-            all_commits.append(
-                {
-                    "hash": commit_hash,
-                    "message": commit_msg,
-                    "timestamp": commit_ts,
-                    "conversation_index": conv_idx,
-                }
-            )
-
-    # Count prompts (non-continuation conversations)
-    total_prompts = sum(1 for c in conversations if not c.get("is_continuation"))
-
-    return {
-        "metadata": {
-            "github_repo": github_repo,
-            "generated_at": datetime.now(timezone.utc)
-            .isoformat()
-            .replace("+00:00", "Z"),
-        },
-        "stats": {
-            "total_prompts": total_prompts,
-            "total_messages": total_messages,
-            "total_tool_calls": sum(total_tool_counts.values()),
-            "total_commits": len(all_commits),
-            "tool_counts": total_tool_counts,
-        },
-        "conversations": conversations,
-        "commits": all_commits,
-    }
+    return _build_json_output(session_data.get("loglines", []), github_repo)
 
 
 @cli.command("web")
-@click.argument("session_id", required=True)
+@click.argument("session_ids", nargs=-1, required=True)
 @click.option(
     "-o",
     "--output",
@@ -2132,20 +2366,39 @@ def generate_json_output_from_session_data(session_data, github_repo=None):
     "--repo",
     help="GitHub repo (owner/name) for commit links.",
 )
-def web_cmd(session_id, output, token, org_uuid, repo):
-    """Fetch and convert a web session from the Claude API to JSON.
+@click.option(
+    "--pretty/--compact",
+    default=False,
+    help="Indent the JSON output for readability (default: compact).",
+)
+@click.option(
+    "--array",
+    "as_array",
+    is_flag=True,
+    help="Output a JSON array of sessions (required for more than one session).",
+)
+def web_cmd(session_ids, output, token, org_uuid, repo, pretty, as_array):
+    """Fetch and convert web sessions from the Claude API to JSON.
 
-    SESSION_ID is the session ID to fetch from the API.
+    SESSION_IDS are the session IDs to fetch from the API. Sessions are
+    fetched concurrently. A single session is output as a JSON object; with
+    --array the output is a JSON array of sessions in the order given.
     """
+    if len(session_ids) > 1 and not as_array:
+        raise click.UsageError("Pass --array to fetch more than one session.")
+
     try:
         token, org_uuid = resolve_credentials(token, org_uuid)
     except click.ClickException:
         raise
 
-    # Fetch the session
-    click.echo(f"Fetching session {session_id}...", err=True)
+    # Fetch the sessions
+    if len(session_ids) == 1:
+        click.echo(f"Fetching session {session_ids[0]}...", err=True)
+    else:
+        click.echo(f"Fetching {len(session_ids)} sessions...", err=True)
     try:
-        session_data = fetch_session(token, org_uuid, session_id)
+        sessions_data = fetch_sessions_by_id(token, org_uuid, session_ids)
     except httpx.HTTPStatusError as e:
         raise click.ClickException(
             f"API request failed: {e.response.status_code} {e.response.text}"
@@ -2154,17 +2407,13 @@ def web_cmd(session_id, output, token, org_uuid, repo):
         raise click.ClickException(f"Network error: {e}")
 
     # Generate JSON output
-    result = generate_json_output_from_session_data(session_data, github_repo=repo)
+    results = [
+        generate_json_output_from_session_data(session_data, github_repo=repo)
+        for session_data in sessions_data
+    ]
 
     # Output to file or stdout
-    if output:
-        output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        click.echo(f"Output: {output_path.resolve()}", err=True)
-    else:
-        click.echo(json.dumps(result, indent=2, ensure_ascii=False))
+    write_json_output(results if as_array else results[0], output, pretty=pretty)
 
 
 @cli.command("all")
@@ -148,6 +148,44 @@ class TestFindAllSessions:
                 for i in range(len(sessions) - 1):
                     assert sessions[i]["mtime"] >= sessions[i + 1]["mtime"]
 
+    def test_summarizes_in_worker_processes(self, mock_projects_dir, monkeypatch):
+        """Test that worker processes are used for large batches and agree with serial."""
+        import claude_code_transcripts
+
+        pool_results = []
+
+        class RecordingExecutor(claude_code_transcripts.ProcessPoolExecutor):
+            def map(self, *args, **kwargs):
+                results = list(super().map(*args, **kwargs))
+                pool_results.append(results)
+                return results
+
+        serial = find_all_sessions(mock_projects_dir)
+        assert pool_results == []
+
+        monkeypatch.setattr(
+            "claude_code_transcripts.ProcessPoolExecutor", RecordingExecutor
+        )
+        monkeypatch.setattr("claude_code_transcripts.PARALLEL_SUMMARY_MIN_BYTES", 1)
+        monkeypatch.setattr("claude_code_transcripts.os.cpu_count", lambda: 2)
+        parallel = find_all_sessions(mock_projects_dir)
+
+        assert len(pool_results) == 1
+        assert parallel == serial
+
+    def test_stays_serial_on_single_cpu(self, mock_projects_dir, monkeypatch):
+        """Test that no process pool is started when only one CPU is available."""
+
+        def fail_pool(*args, **kwargs):
+            raise AssertionError("ProcessPoolExecutor should not be used")
+
+        monkeypatch.setattr("claude_code_transcripts.ProcessPoolExecutor", fail_pool)
+        monkeypatch.setattr("claude_code_transcripts.PARALLEL_SUMMARY_MIN_BYTES", 1)
+        monkeypatch.setattr("claude_code_transcripts.os.cpu_count", lambda: 1)
+
+        projects = find_all_sessions(mock_projects_dir)
+        assert len(projects) == 2
+
     def test_returns_empty_for_nonexistent_folder(self):
         """Test handling of non-existent folder."""
         result = find_all_sessions(Path("/nonexistent/path"))
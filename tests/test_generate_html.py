@@ -27,6 +27,7 @@ from claude_code_transcripts import (
     parse_session_file,
     get_session_summary,
     find_local_sessions,
+    open_summary_cache,
 )
 
 
@@ -904,6 +905,75 @@ class TestFindLocalSessions:
         assert results[0][0] == session_file
         assert results[0][1] == "Test session"
 
+    def test_reuses_cached_summaries_for_unchanged_files(self, tmp_path):
+        """Test that cached summaries are used until the file changes."""
+        projects_dir = tmp_path / ".claude" / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+        session_file = projects_dir / "session-123.jsonl"
+        session_file.write_text('{"type":"summary","summary":"Original"}\n')
+
+        cache = {}
+        results = find_local_sessions(projects_dir, limit=10, cache=cache)
+        assert results[0][1] == "Original"
+        assert str(session_file) in cache
+
+        # A cached summary is returned while mtime and size are unchanged
+        signature = cache[str(session_file)][0]
+        cache[str(session_file)] = (signature, "From cache")
+        results = find_local_sessions(projects_dir, limit=10, cache=cache)
+        assert results[0][1] == "From cache"
+
+        # Changing the file invalidates the entry
+        session_file.write_text('{"type":"summary","summary":"Updated summary"}\n')
+        results = find_local_sessions(projects_dir, limit=10, cache=cache)
+        assert results[0][1] == "Updated summary"
+
+    def test_summary_cache_drops_entries_for_removed_files(self, tmp_path):
+        """Test that cache entries for files that no longer exist are removed."""
+        projects_dir = tmp_path / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+        kept = projects_dir / "kept.jsonl"
+        kept.write_text('{"type":"summary","summary":"Kept"}\n')
+        removed = projects_dir / "removed.jsonl"
+        removed.write_text('{"type":"summary","summary":"Removed"}\n')
+
+        cache = {}
+        find_local_sessions(projects_dir, limit=10, cache=cache)
+        assert set(cache) == {str(kept), str(removed)}
+
+        removed.unlink()
+        find_local_sessions(projects_dir, limit=10, cache=cache)
+        assert set(cache) == {str(kept)}
+
+    def test_summary_cache_write_failure_does_not_block_listing(self, tmp_path):
+        """Test that sessions are still listed when the cache cannot be written."""
+
+        class ReadOnlyCache(dict):
+            def __setitem__(self, key, value):
+                raise OSError("read-only cache")
+
+        projects_dir = tmp_path / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+        (projects_dir / "session-123.jsonl").write_text(
+            '{"type":"summary","summary":"Test session"}\n'
+        )
+
+        results = find_local_sessions(projects_dir, limit=10, cache=ReadOnlyCache())
+        assert [summary for _, summary in results] == ["Test session"]
+
+    def test_summary_cache_persists_to_disk(self, tmp_path):
+        """Test that open_summary_cache stores entries between runs."""
+        projects_dir = tmp_path / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+        session_file = projects_dir / "session-123.jsonl"
+        session_file.write_text('{"type":"summary","summary":"Cached session"}\n')
+        cache_path = tmp_path / "cache" / "summaries"
+
+        with open_summary_cache(cache_path) as cache:
+            find_local_sessions(projects_dir, limit=10, cache=cache)
+        with open_summary_cache(cache_path) as cache:
+            assert cache[str(session_file)][1] == "Cached session"
+
     def test_excludes_agent_files(self, tmp_path):
         """Test that agent- prefixed files are excluded."""
         projects_dir = tmp_path / ".claude" / "projects" / "test-project"
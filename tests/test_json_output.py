@@ -1,32 +1,43 @@
 """Tests for JSON output functionality."""
 
+import asyncio
 import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import httpx
 import pytest
 from click.testing import CliRunner
 
 from claude_code_transcripts import (
     cli,
+    dumps_json,
+    fetch_sessions_by_id,
     generate_json_output,
+    iter_json_chunks,
     parse_session_file,
 )
 
 
+@pytest.fixture(scope="module")
+def basic_session_path():
+    """Path to a two-message (user prompt + assistant reply) JSONL session."""
+    return Path(__file__).parent / "basic_session.jsonl"
+
+
+@pytest.fixture(scope="module")
+def basic_session_output(basic_session_path):
+    """generate_json_output result for the basic session, shared by read-only tests."""
+    return generate_json_output(basic_session_path)
+
+
 class TestGenerateJsonOutput:
     """Tests for the generate_json_output function."""
 
-    def test_returns_dict_with_required_keys(self, tmp_path):
+    def test_returns_dict_with_required_keys(self, basic_session_output):
         """Test that generate_json_output returns dict with required top-level keys."""
-        jsonl_file = tmp_path / "test.jsonl"
-        jsonl_file.write_text(
-            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
-            '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"text","text":"Hi!"}]}}\n'
-        )
-
-        result = generate_json_output(jsonl_file)
+        result = basic_session_output
 
         assert "metadata" in result
         assert "stats" in result
@@ -61,15 +72,9 @@ class TestGenerateJsonOutput:
 
         assert result["metadata"]["github_repo"] == "owner/repo"
 
-    def test_stats_has_required_fields(self, tmp_path):
+    def test_stats_has_required_fields(self, basic_session_output):
         """Test that stats includes all required fields."""
-        jsonl_file = tmp_path / "test.jsonl"
-        jsonl_file.write_text(
-            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
-            '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"text","text":"Hi!"}]}}\n'
-        )
-
-        result = generate_json_output(jsonl_file)
+        result = basic_session_output
 
         assert "total_prompts" in result["stats"]
         assert "total_messages" in result["stats"]
@@ -77,15 +82,9 @@ class TestGenerateJsonOutput:
         assert "total_commits" in result["stats"]
         assert "tool_counts" in result["stats"]
 
-    def test_conversations_has_required_fields(self, tmp_path):
+    def test_conversations_has_required_fields(self, basic_session_output):
         """Test that each conversation has required fields."""
-        jsonl_file = tmp_path / "test.jsonl"
-        jsonl_file.write_text(
-            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
-            '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"text","text":"Hi!"}]}}\n'
-        )
-
-        result = generate_json_output(jsonl_file)
+        result = basic_session_output
 
         assert len(result["conversations"]) == 1
         conv = result["conversations"][0]
@@ -140,6 +139,18 @@ class TestGenerateJsonOutput:
         assert result["stats"]["tool_counts"]["Bash"] == 1
         assert result["stats"]["tool_counts"]["Read"] == 1
 
+    def test_ignores_blocks_with_non_string_type(self, tmp_path):
+        """Test that content blocks whose type is not a string are skipped."""
+        jsonl_file = tmp_path / "test.jsonl"
+        jsonl_file.write_text(
+            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
+            '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":{"k":1}},{"type":["x"]},{"type":"tool_use","name":"Bash","id":"1","input":{}}]}}\n'
+        )
+
+        result = generate_json_output(jsonl_file)
+
+        assert result["stats"]["tool_counts"] == {"Bash": 1}
+
     def test_extracts_commits(self, tmp_path):
         """Test that git commits are extracted."""
         jsonl_file = tmp_path / "test.jsonl"
@@ -166,20 +177,111 @@ class TestGenerateJsonOutput:
 
         assert result["metadata"]["github_repo"] == "custom/repo"
 
+    def test_skips_github_repo_detection_when_provided(
+        self, basic_session_path, monkeypatch
+    ):
+        """Test that tool results are not scanned when github_repo is given."""
 
-class TestJsonCommand:
-    """Tests for the json CLI command with JSON output."""
+        def fail_detect(loglines):
+            raise AssertionError("detect_github_repo should not be called")
 
-    def test_outputs_json_to_stdout(self, tmp_path, capsys):
-        """Test that json command outputs JSON to stdout."""
+        monkeypatch.setattr("claude_code_transcripts.detect_github_repo", fail_detect)
+
+        result = generate_json_output(basic_session_path, github_repo="custom/repo")
+
+        assert result["metadata"]["github_repo"] == "custom/repo"
+
+
+class TestParseSessionFile:
+    """Tests for parse_session_file with and without orjson."""
+
+    def test_jsonl_parsing_matches_stdlib_fallback(self, tmp_path, monkeypatch):
+        """Test that JSONL parsing gives the same result with the stdlib fallback."""
         jsonl_file = tmp_path / "test.jsonl"
         jsonl_file.write_text(
+            '{"type":"summary","summary":"Ignored"}\n'
             '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
+            "not valid json\n"
+            "\n"
+            '{"type":"user","timestamp":"2025-01-01T10:00:01.000Z","message":{"role":"user","content":"cut \\ud83d"}}\n'
             '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"text","text":"Hi!"}]}}\n'
         )
 
+        fast = parse_session_file(jsonl_file)
+        monkeypatch.setattr("claude_code_transcripts.orjson", None)
+        slow = parse_session_file(jsonl_file)
+
+        assert fast == slow
+        assert [entry["type"] for entry in fast["loglines"]] == [
+            "user",
+            "user",
+            "assistant",
+        ]
+        assert fast["loglines"][1]["message"]["content"] == "cut \ud83d"
+
+    def test_jsonl_handles_crlf_and_invalid_utf8_lines(self, tmp_path):
+        """Test that CRLF line endings work and undecodable lines are skipped."""
+        jsonl_file = tmp_path / "test.jsonl"
+        jsonl_file.write_bytes(
+            b'{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\r\n'
+            b'{"type":"user","message":{"content":"\xff\xfe"}}\r\n'
+            b'{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"text","text":"Hi!"}]}}'
+        )
+
+        result = parse_session_file(jsonl_file)
+
+        assert [entry["timestamp"] for entry in result["loglines"]] == [
+            "2025-01-01T10:00:00.000Z",
+            "2025-01-01T10:00:05.000Z",
+        ]
+
+    def test_jsonl_interns_repeated_strings(self, tmp_path):
+        """Test that roles, block types and tool names are interned."""
+        jsonl_file = tmp_path / "test.jsonl"
+        jsonl_file.write_text(
+            '{"type":"assistant","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"assistant","content":[{"type":"tool_use","name":"Bash","id":"1","input":{}}]}}\n'
+            '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"tool_use","name":"Bash","id":"2","input":{}}]}}\n'
+        )
+
+        first, second = parse_session_file(jsonl_file)["loglines"]
+
+        assert first["type"] is second["type"]
+        assert first["message"]["role"] is second["message"]["role"]
+        first_block = first["message"]["content"][0]
+        second_block = second["message"]["content"][0]
+        assert first_block["type"] is second_block["type"]
+        assert first_block["name"] is second_block["name"]
+
+
+class TestIterJsonChunks:
+    """Tests for streaming JSON serialization."""
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_chunks_match_dumps_json(self, use_orjson, pretty, monkeypatch):
+        """Test that the streamed chunks join to the same bytes as dumps_json."""
+        if not use_orjson:
+            monkeypatch.setattr("claude_code_transcripts.orjson", None)
+        session_path = Path(__file__).parent / "sample_session.jsonl"
+        result = generate_json_output(session_path)
+        result["empty"] = []
+        result["nested"] = {"list": [1, {"a": "line\nbreak"}], "empty": {}}
+
+        assert b"".join(iter_json_chunks(result, pretty)) == dumps_json(result, pretty)
+
+    @pytest.mark.parametrize("obj", [{}, [], [1, 2], "text", None])
+    def test_non_dict_values(self, obj):
+        """Test that values other than non-empty dicts are serialized whole."""
+        assert b"".join(iter_json_chunks(obj)) == dumps_json(obj)
+
+
+class TestJsonCommand:
+    """Tests for the json CLI command with JSON output."""
+
+    def test_outputs_json_to_stdout(self, basic_session_path):
+        """Test that json command outputs JSON to stdout."""
         runner = CliRunner()
-        result = runner.invoke(cli, ["json", str(jsonl_file)])
+        result = runner.invoke(cli, ["json", str(basic_session_path)])
 
         assert result.exit_code == 0
         # Output should be valid JSON
@@ -204,6 +306,29 @@ class TestJsonCommand:
             data = json.load(f)
         assert "metadata" in data
 
+    def test_outputs_compact_json_by_default(self, basic_session_path):
+        """Test that output is compact unless --pretty is given."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["json", str(basic_session_path)])
+
+        assert result.exit_code == 0
+        assert result.output.strip().count("\n") == 0
+        assert '"metadata":{' in result.output
+
+    def test_pretty_option_indents_output(self, basic_session_path, tmp_path):
+        """Test that --pretty indents output on stdout and in files."""
+        output_file = tmp_path / "output.json"
+        runner = CliRunner()
+        result = runner.invoke(cli, ["json", str(basic_session_path), "--pretty"])
+        file_result = runner.invoke(
+            cli, ["json", str(basic_session_path), "--pretty", "-o", str(output_file)]
+        )
+
+        assert result.exit_code == 0
+        assert file_result.exit_code == 0
+        assert '\n  "metadata": {' in result.output
+        assert '\n  "metadata": {' in output_file.read_text(encoding="utf-8")
+
     def test_repo_option_sets_github_repo(self, tmp_path):
         """Test that --repo option sets github_repo in output."""
         jsonl_file = tmp_path / "test.jsonl"
@@ -218,6 +343,58 @@ class TestJsonCommand:
         output_data = json.loads(result.output)
         assert output_data["metadata"]["github_repo"] == "my/repo"
 
+    def test_output_preserves_non_ascii_text(self, tmp_path):
+        """Test that non-ASCII text is written as UTF-8 rather than escaped."""
+        jsonl_file = tmp_path / "test.jsonl"
+        jsonl_file.write_text(
+            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Héllo wörld ✨"}}\n',
+            encoding="utf-8",
+        )
+        output_file = tmp_path / "output.json"
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["json", str(jsonl_file), "-o", str(output_file)])
+
+        assert result.exit_code == 0
+        raw = output_file.read_text(encoding="utf-8")
+        assert "Héllo wörld ✨" in raw
+        assert json.loads(raw)["conversations"][0]["user_text"] == "Héllo wörld ✨"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_outputs_lone_surrogates_as_escapes(
+        self, tmp_path, monkeypatch, use_orjson
+    ):
+        """Test that text with a truncated emoji is kept and written as valid JSON."""
+        if not use_orjson:
+            monkeypatch.setattr("claude_code_transcripts.orjson", None)
+        jsonl_file = tmp_path / "test.jsonl"
+        jsonl_file.write_text(
+            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"cut \\ud83d"}}\n'
+        )
+        output_file = tmp_path / "output.json"
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["json", str(jsonl_file), "-o", str(output_file)])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(output_file.read_bytes())
+        assert data["conversations"][0]["user_text"] == "cut \ud83d"
+
+    def test_outputs_json_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the stdlib json fallback is used when orjson is unavailable."""
+        monkeypatch.setattr("claude_code_transcripts.orjson", None)
+        jsonl_file = tmp_path / "test.jsonl"
+        jsonl_file.write_text(
+            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["json", str(jsonl_file)])
+
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data["conversations"][0]["user_text"] == "Hello"
+
 
 class TestLocalCommand:
     """Tests for the local CLI command with Rich table output."""
@@ -234,8 +411,10 @@ class TestLocalCommand:
             '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
         )
 
-        # Mock Path.home() to return our tmp_path
+        # Mock Path.home() to return our tmp_path, and keep the summary
+        # cache out of any real XDG_CACHE_HOME
         monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
         runner = CliRunner()
         result = runner.invoke(cli, ["local", "--limit", "5"])
@@ -267,8 +446,10 @@ class TestLocalCommand:
             '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
         )
 
-        # Mock Path.home() to return our tmp_path
+        # Mock Path.home() to return our tmp_path, and keep the summary
+        # cache out of any real XDG_CACHE_HOME
         monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
         runner = CliRunner()
         result = runner.invoke(cli, ["local", "--limit", "5", "--json"])
@@ -280,17 +461,32 @@ class TestLocalCommand:
         assert "path" in output_data[0]
         assert "summary" in output_data[0]
 
-    def test_with_file_path_outputs_session_json(self, tmp_path, monkeypatch):
-        """Test that local with file path outputs session JSON."""
-        # Create a session file
-        session_file = tmp_path / "session.jsonl"
-        session_file.write_text(
-            '{"type":"user","timestamp":"2025-01-01T10:00:00.000Z","message":{"role":"user","content":"Hello"}}\n'
-            '{"type":"assistant","timestamp":"2025-01-01T10:00:05.000Z","message":{"role":"assistant","content":[{"type":"text","text":"Hi!"}]}}\n'
+    def test_skips_broken_symlinks(self, tmp_path, monkeypatch):
+        """Test that a dangling session symlink is skipped rather than crashing."""
+        projects_dir = tmp_path / ".claude" / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+        (projects_dir / "session-123.jsonl").write_text(
+            '{"type":"summary","summary":"Test session"}\n'
         )
+        try:
+            (projects_dir / "broken.jsonl").symlink_to(tmp_path / "nonexistent")
+        except OSError:
+            pytest.skip("Symlinks are not supported on this platform")
+
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
         runner = CliRunner()
-        result = runner.invoke(cli, ["local", str(session_file)])
+        result = runner.invoke(cli, ["local", "--json"])
+
+        assert result.exit_code == 0, result.output
+        output_data = json.loads(result.output)
+        assert [Path(s["path"]).name for s in output_data] == ["session-123.jsonl"]
+
+    def test_with_file_path_outputs_session_json(self, basic_session_path):
+        """Test that local with file path outputs session JSON."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["local", str(basic_session_path)])
 
         assert result.exit_code == 0
         output_data = json.loads(result.output)
@@ -359,3 +555,137 @@ class TestWebCommand:
         output_data = json.loads(output[json_start:])
         assert "metadata" in output_data
         assert "conversations" in output_data
+
+    def test_fetch_sessions_by_id_shares_one_client(self, monkeypatch):
+        """Test that every request in one fetch goes through a single client."""
+        requests = []
+        clients = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"loglines": [], "id": request.url.path})
+
+        def make_client():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            clients.append(client)
+            return client
+
+        monkeypatch.setattr("claude_code_transcripts.make_api_client", make_client)
+
+        session_ids = [f"session-{i}" for i in range(3)]
+        results = fetch_sessions_by_id("test-token", "test-org", session_ids)
+
+        assert [r["id"] for r in results] == [
+            f"/v1/session_ingress/session/{session_id}" for session_id in session_ids
+        ]
+        assert len(clients) == 1
+        assert clients[0].is_closed
+        assert len(requests) == 3
+        assert all(r.headers["Authorization"] == "Bearer test-token" for r in requests)
+
+    def test_fetches_multiple_sessions_concurrently(self, httpx_mock):
+        """Test that several session IDs are output as a JSON array in order."""
+        for session_id, text in (("first", "Hello"), ("second", "Goodbye")):
+            httpx_mock.add_response(
+                url=f"https://api.anthropic.com/v1/session_ingress/session/{session_id}",
+                json={
+                    "loglines": [
+                        {
+                            "type": "user",
+                            "timestamp": "2025-01-01T10:00:00.000Z",
+                            "message": {"role": "user", "content": text},
+                        }
+                    ]
+                },
+            )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "web",
+                "first",
+                "second",
+                "--array",
+                "--token",
+                "test-token",
+                "--org-uuid",
+                "test-org",
+            ],
+        )
+
+        assert result.exit_code == 0
+        output = result.output
+        output_data = json.loads(output[output.find("[") :])
+        assert [r["conversations"][0]["user_text"] for r in output_data] == [
+            "Hello",
+            "Goodbye",
+        ]
+
+    def test_multiple_sessions_require_array_flag(self):
+        """Test that several session IDs without --array are rejected."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "web",
+                "first",
+                "second",
+                "--token",
+                "test-token",
+                "--org-uuid",
+                "test-org",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "--array" in result.output
+
+    def test_array_flag_wraps_single_session(self, httpx_mock):
+        """Test that --array outputs a JSON array even for one session."""
+        httpx_mock.add_response(
+            url="https://api.anthropic.com/v1/session_ingress/session/only",
+            json={"loglines": []},
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "web",
+                "only",
+                "--array",
+                "--token",
+                "test-token",
+                "--org-uuid",
+                "test-org",
+            ],
+        )
+
+        assert result.exit_code == 0
+        output = result.output
+        output_data = json.loads(output[output.find("[") :])
+        assert len(output_data) == 1
+        assert "metadata" in output_data[0]
+
+    def test_fetch_sessions_by_id_caps_concurrency(self, monkeypatch):
+        """Test that no more than MAX_CONCURRENT_FETCHES requests run at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(token, org_uuid, session_id, client):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": session_id}
+
+        monkeypatch.setattr("claude_code_transcripts.fetch_session_async", fake_fetch)
+        monkeypatch.setattr("claude_code_transcripts.MAX_CONCURRENT_FETCHES", 2)
+
+        session_ids = [f"session-{i}" for i in range(5)]
+        results = fetch_sessions_by_id("test-token", "test-org", session_ids)
+
+        assert [r["id"] for r in results] == session_ids
+        assert max_in_flight == 2